@@ -119,6 +119,8 @@ from gym.envs import register
 from gym.envs.registration import EnvSpec
 from gym_dmc.dmc_env import DMCEnv, convert_dm_control_to_gym_space
 
+from lcs.frame_stack import FrameBuffer
+
 
 class LCSEnv(DMCEnv):
     def __init__(self, domain_name, task_name,
@@ -132,6 +134,7 @@ class LCSEnv(DMCEnv):
                  channels_first=True,
                  from_pixels=False,
                  gray_scale=False,
+                 frame_stack=None,  # number of stacked frames in from_pixels mode
                  warmstart=True,  # info: https://github.com/deepmind/dm_control/issues/64
                  no_gravity=False,
                  non_newtonian=False,
@@ -151,7 +154,7 @@ class LCSEnv(DMCEnv):
         self.channels_first = channels_first
         obs_spec = self.env.observation_spec()
         if from_pixels:
-            color_dim = 1 if gray_scale else 3
+            color_dim = (1 if gray_scale else 3) * (frame_stack or 1)
             image_shape = [color_dim, width, height] if channels_first else [width, height, color_dim]
             self.observation_space = convert_dm_control_to_gym_space(
                 obs_spec, dtype=space_dtype,
@@ -161,6 +164,9 @@ class LCSEnv(DMCEnv):
             self.observation_space = convert_dm_control_to_gym_space(obs_spec, dtype=space_dtype)
         self.action_space = convert_dm_control_to_gym_space(self.env.action_spec(), dtype=space_dtype)
         self.viewer = None
+        # info: the stacked pixels are a view into this buffer. They stay valid through the next step or reset,
+        #   copy them to keep them longer.
+        self.frames = FrameBuffer(frame_stack, channels_first) if from_pixels and frame_stack else None
 
         self.render_kwargs = dict(
             height=height,
@@ -184,10 +190,26 @@ class LCSEnv(DMCEnv):
             obs = self.env.step([0]).observation
 
         if self.from_pixels:
+            if self.frames is not None:
+                self.frames.reset()
             obs['pixels'] = self._get_obs_pixels()
 
         return obs
 
+    def step(self, action):
+        obs, reward, done, info = super().step(action)
+        # info: same as the dm_control TimeStep.discount. Episodes that end on the time limit keep a
+        #   discount of 1.0, so learners can tell these truncations apart from terminations.
+        termination = self.env.task.get_termination(self.env.physics)
+        info['discount'] = 1.0 if termination is None else termination
+        return obs, reward, done, info
+
+    def _get_obs_pixels(self):
+        frame = super()._get_obs_pixels()
+        if self.frames is None:
+            return frame
+        return self.frames.push(frame)
+
 
 def make_gym_env(flatten_obs=True, from_pixels=False, frame_skip=1, episode_frames=1000, id=None, **kwargs):
     max_episode_steps = episode_frames / frame_skip
@@ -25,6 +25,7 @@ from dm_control.suite.utils import randomizers
 from dm_control.utils import containers
 from dm_control.utils import rewards
 
+from lcs import physics_profiles
 
 _DEFAULT_TIME_LIMIT = 25
 _CONTROL_TIMESTEP = .025
@@ -39,6 +40,13 @@ _RUN_SPEED = 8
 
 SUITE = containers.TaggedTasks()
 
+# Physics profiles, see `lcs.physics_profiles`. `default` matches the model XML.
+PHYSICS_PROFILES = {
+    'accurate': dict(n_sub_steps=20, integrator='Euler', iterations=100, tolerance=1e-10),
+    'default': dict(n_sub_steps=10, integrator='Euler'),
+    'fast': dict(n_sub_steps=5, integrator='Euler', iterations=20, tolerance=1e-6),
+}
+
 
 def get_model_and_assets():
   """Returns a tuple containing the model XML string and a dict of assets."""
@@ -46,9 +54,12 @@ def get_model_and_assets():
 
 
 @SUITE.add('benchmarking')
-def stand(time_limit=_DEFAULT_TIME_LIMIT, random=None, environment_kwargs=None):
+def stand(time_limit=_DEFAULT_TIME_LIMIT, random=None, environment_kwargs=None,
+          physics_profile='default'):
   """Returns the Stand task."""
   physics = Physics.from_xml_string(*get_model_and_assets())
+  physics_profiles.apply(physics, PHYSICS_PROFILES, physics_profile,
+                         _CONTROL_TIMESTEP)
   task = PlanarWalker(move_speed=0, random=random)
   environment_kwargs = environment_kwargs or {}
   return control.Environment(
@@ -57,9 +68,12 @@ def stand(time_limit=_DEFAULT_TIME_LIMIT, random=None, environment_kwargs=None):
 
 
 @SUITE.add('benchmarking')
-def walk(time_limit=_DEFAULT_TIME_LIMIT, random=None, environment_kwargs=None):
+def walk(time_limit=_DEFAULT_TIME_LIMIT, random=None, environment_kwargs=None,
+         physics_profile='default'):
   """Returns the Walk task."""
   physics = Physics.from_xml_string(*get_model_and_assets())
+  physics_profiles.apply(physics, PHYSICS_PROFILES, physics_profile,
+                         _CONTROL_TIMESTEP)
   task = PlanarWalker(move_speed=_WALK_SPEED, random=random)
   environment_kwargs = environment_kwargs or {}
   return control.Environment(
@@ -68,9 +82,12 @@ def walk(time_limit=_DEFAULT_TIME_LIMIT, random=None, environment_kwargs=None):
 
 
 @SUITE.add('benchmarking')
-def run(time_limit=_DEFAULT_TIME_LIMIT, random=None, environment_kwargs=None):
+def run(time_limit=_DEFAULT_TIME_LIMIT, random=None, environment_kwargs=None,
+        physics_profile='default'):
   """Returns the Run task."""
   physics = Physics.from_xml_string(*get_model_and_assets())
+  physics_profiles.apply(physics, PHYSICS_PROFILES, physics_profile,
+                         _CONTROL_TIMESTEP)
   task = PlanarWalker(move_speed=_RUN_SPEED, random=random)
   environment_kwargs = environment_kwargs or {}
   return control.Environment(
@@ -0,0 +1,131 @@
+"""Helpers for evaluating policies over sets of LCS tasks."""
+
+import importlib
+import pickle
+import sys
+import time
+
+import numpy as np
+
+import lcs
+
+
+def resolve_tasks(selection):
+    """Returns a tuple of (domain name, task name) pairs for a task selection.
+
+    Each entry of `selection` may be the name of a task set in `lcs` (e.g.
+    `'BENCHMARKING'`, `'EASY'`, `'HARD'`, `'ALL_TASKS'`), a domain name from
+    `TASKS_BY_DOMAIN`, a `'domain:task'` pair, or a gym id such as
+    `'Paramcartpole-swingup-v1'`.
+
+    Raises:
+      ValueError: If an entry does not match any task.
+    """
+    if isinstance(selection, str):
+        selection = [selection]
+
+    by_id = {f'{domain_name.capitalize()}-{task_name}-v1': (domain_name, task_name)
+             for domain_name, task_name in lcs.ALL_TASKS}
+    result = []
+    for entry in selection:
+        if entry.isupper() and isinstance(getattr(lcs, entry, None), tuple):
+            tasks = getattr(lcs, entry)
+        elif entry in lcs.TASKS_BY_DOMAIN:
+            tasks = [(entry, task_name) for task_name in lcs.TASKS_BY_DOMAIN[entry]]
+        elif entry in by_id:
+            tasks = [by_id[entry]]
+        elif ':' in entry and tuple(entry.split(':', 1)) in lcs.ALL_TASKS:
+            tasks = [tuple(entry.split(':', 1))]
+        else:
+            raise ValueError('Task selection {!r} does not match any task.'.format(entry))
+        result.extend(task for task in tasks if task not in result)
+    return tuple(result)
+
+
+def load_policy(spec):
+    """Returns a policy, given an import path or the path of a saved checkpoint.
+
+    The policy is a callable mapping an observation to an action. `spec` can be
+    `'random'`, an import path `'package.module:attribute'`, or a file saved
+    with `torch.save` (`.pt`, `.pth`) or `pickle`. Torch modules are wrapped in
+    a `TorchPolicy`, so that they take and return numpy arrays.
+
+    Checkpoints are unpickled in full (`weights_only=False`), so only load
+    files you trust.
+
+    Raises:
+      ValueError: If the checkpoint is a state_dict, or the policy is not callable.
+    """
+    if spec == 'random':
+        return None
+    if spec.endswith(('.pt', '.pth')):
+        import torch
+
+        # A whole module is not loadable with the `weights_only=True` default of torch>=2.6.
+        policy = torch.load(spec, map_location='cpu', weights_only=False)
+        if isinstance(policy, dict):
+            raise ValueError('Checkpoint {!r} is a state_dict. Save the whole module with `torch.save(module, path)`, '
+                             'or pass the import path of a function that builds and loads it.'.format(spec))
+    elif spec.endswith(('.pkl', '.pickle')):
+        with open(spec, 'rb') as f:
+            policy = pickle.load(f)
+    else:
+        module_name, _, attribute = spec.partition(':')
+        policy = importlib.import_module(module_name)
+        for name in attribute.split('.') if attribute else []:
+            policy = getattr(policy, name)
+    if not callable(policy):
+        raise ValueError('Policy {!r} is not callable.'.format(spec))
+    if 'torch' in sys.modules and isinstance(policy, sys.modules['torch'].nn.Module):
+        policy = TorchPolicy(policy)
+    return policy
+
+
+class TorchPolicy:
+    """Adapts a torch module to map numpy observations to numpy actions."""
+
+    def __init__(self, module):
+        self.module = module.eval()
+
+    def __call__(self, obs):
+        import torch
+
+        with torch.no_grad():
+            action = self.module(torch.as_tensor(obs, dtype=torch.float32))
+        return action.cpu().numpy()
+
+
+def run_episode(domain_name, task_name, seed, policy=None, task_kwargs=None, **env_kwargs):
+    """Runs a single episode and returns a dict with its return, steps and timing.
+
+    `wall_time` includes building the environment. `started` and `finished`
+    are `time.time()` timestamps, comparable across worker processes.
+
+    Args:
+      domain_name: A string containing the name of a domain.
+      task_name: A string containing the name of a task.
+      seed: An integer seed for the task, used for the initial state.
+      policy: A callable mapping an observation to an action. `None` samples
+        random actions.
+      task_kwargs: Optional `dict` of keyword arguments for the task, e.g.
+        `physics_profile`.
+      **env_kwargs: Extra keyword arguments for `lcs.make_gym_env`.
+    """
+    started = time.time()
+    start = time.perf_counter()
+    env = lcs.make_gym_env(domain_name=domain_name, task_name=task_name,
+                           task_kwargs=dict(task_kwargs or {}, random=seed), **env_kwargs)
+    env.action_space.seed(seed)
+
+    obs, done, episode_return, steps = env.reset(), False, 0.0, 0
+    while not done:
+        action = env.action_space.sample() if policy is None else np.asarray(policy(obs))
+        obs, reward, done, info = env.step(action)
+        episode_return += reward
+        steps += 1
+    env.close()
+    wall_time = time.perf_counter() - start
+
+    return dict(domain_name=domain_name, task_name=task_name, seed=seed,
+                episode_return=episode_return, steps=steps * env.unwrapped.frame_skip, wall_time=wall_time,
+                started=started, finished=started + wall_time)
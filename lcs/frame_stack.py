@@ -0,0 +1,77 @@
+"""Zero-copy frame stacking for pixel observations."""
+
+import numpy as np
+
+
+class FrameBuffer:
+    """Linear buffer holding the last `k` frames as one stacked observation.
+
+    Frames are appended to a buffer with `3k` slots, and `push` returns the last
+    `k` of them as a view into the buffer instead of copying the whole
+    `k x C x H x W` array every step. When the end of the buffer is reached, the
+    `k - 1` most recent frames are moved to the front, which costs less than one
+    frame copy per step on average.
+
+    An observation stays valid through the next `push` or `reset`, so the usual
+    `next_obs, ... = env.step(action); replay.add(obs, action, ..., next_obs)`
+    pattern sees both intact. It is overwritten after that, so consumers that
+    keep observations longer (e.g. a replay buffer) have to copy them.
+
+    Args:
+      k: Number of stacked frames.
+      channels_first: If `True`, frames are `(C, H, W)` and the stack is
+        `(k * C, H, W)`. Otherwise frames are `(H, W, C)` and the stack is
+        `(H, W, k * C)`.
+    """
+
+    def __init__(self, k, channels_first=True):
+        self.k = k
+        self.channels_first = channels_first
+        self._length = 3 * k
+        self._buffer = None
+        self._position = -1
+        self._empty = True
+
+    def reset(self):
+        """Marks the buffer as empty, so that the next frame fills the whole stack."""
+        self._empty = True
+
+    def push(self, frame):
+        """Adds `frame` to the stack and returns the stacked observation."""
+        if self._buffer is None or self._frame_shape != frame.shape:
+            self._allocate(frame)
+
+        if self._empty:
+            # Fill k fresh slots, away from the window of the previous observation.
+            start = self._position + 1 if self._position + self.k < self._length else 0
+            self._slots(slice(start, start + self.k))[...] = np.expand_dims(frame, self._axis)
+            self._position = start + self.k - 1
+            self._empty = False
+        else:
+            if self._position + 1 == self._length:
+                # The previous window is the last k slots, so the front k slots are free.
+                self._slots(slice(0, self.k - 1))[...] = self._slots(slice(self._length - self.k + 1, self._length))
+                self._position = self.k - 2
+            self._position += 1
+            self._slots(self._position)[...] = frame
+        return self._slots(slice(self._position - self.k + 1, self._position + 1)).reshape(self._stack_shape)
+
+    def _allocate(self, frame):
+        self._frame_shape = frame.shape
+        self._position = -1
+        self._empty = True
+        if self.channels_first:
+            channels, height, width = frame.shape
+            self._axis = 0
+            self._buffer = np.zeros((self._length, channels, height, width), dtype=frame.dtype)
+            self._stack_shape = (self.k * channels, height, width)
+        else:
+            height, width, channels = frame.shape
+            self._axis = 2
+            self._buffer = np.zeros((height, width, self._length, channels), dtype=frame.dtype)
+            self._stack_shape = (height, width, self.k * channels)
+
+    def _slots(self, index):
+        if self.channels_first:
+            return self._buffer[index]
+        return self._buffer[:, :, index]
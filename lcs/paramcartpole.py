@@ -26,15 +26,35 @@ from dm_control.utils import containers
 from dm_control.utils import rewards
 import numpy as np
 
+from lcs import physics_profiles
+
 _DEFAULT_TIME_LIMIT = 10
+_CONTROL_TIMESTEP = .01
 SUITE = containers.TaggedTasks()
 
+# Physics profiles, see `lcs.physics_profiles`. `default` matches the model XML.
+PHYSICS_PROFILES = {
+    'accurate': dict(n_sub_steps=4, integrator='RK4', iterations=100, tolerance=1e-10),
+    'default': dict(integrator='RK4'),
+    'fast': dict(n_sub_steps=1, integrator='Euler', iterations=20, tolerance=1e-6),
+}
+
 
 class ParametricEnvironment(control.Environment):
+    def __init__(self, physics, task, physics_profile='default', **kwargs):
+        self._physics_profile = physics_profile
+        super().__init__(physics, task, **kwargs)
+        self._profile_control_timestep = self.control_timestep()
+
+    def _reload(self, xml_string):
+        # Reloading replaces the model options, so the profile has to be re-applied.
+        self.physics.reload_from_xml_string(xml_string, common.ASSETS)
+        physics_profiles.apply(self.physics, PHYSICS_PROFILES, self._physics_profile, self._profile_control_timestep)
+
     def reset(self, **kwargs):
         # TODO: make this class general, right now it is specific to the cartpole's _make_model
         new_xml = _make_model(**kwargs)
-        self.physics.reload_from_xml_string(new_xml, common.ASSETS)
+        self._reload(new_xml)
         return super().reset()
 
     def change_model(self, **kwargs):
@@ -42,7 +62,7 @@ class ParametricEnvironment(control.Environment):
         qvel = self.physics.data.qvel.copy()
 
         new_xml = _make_model(**kwargs)
-        self.physics.reload_from_xml_string(new_xml, common.ASSETS)
+        self._reload(new_xml)
 
         with self.physics.reset_context():
             self.physics.data.qpos[:] = qpos
@@ -60,46 +80,58 @@ def get_model_and_assets():
 
 @SUITE.add('benchmarking')
 def balance(time_limit=_DEFAULT_TIME_LIMIT, random=None,
-            environment_kwargs=None):
+            environment_kwargs=None, physics_profile='default'):
     """Returns the Cartpole Balance task."""
+    environment_kwargs = dict(environment_kwargs or {})
+    control_timestep = environment_kwargs.setdefault('control_timestep', _CONTROL_TIMESTEP)
     physics = Physics.from_xml_string(*get_model_and_assets())
+    physics_profiles.apply(physics, PHYSICS_PROFILES, physics_profile, control_timestep)
     task = Balance(swing_up=False, sparse=False, random=random)
-    environment_kwargs = environment_kwargs or {}
     return ParametricEnvironment(
-        physics, task, time_limit=time_limit, **environment_kwargs)
+        physics, task, physics_profile=physics_profile, time_limit=time_limit,
+        **environment_kwargs)
 
 
 @SUITE.add('benchmarking')
 def balance_sparse(time_limit=_DEFAULT_TIME_LIMIT, random=None,
-                   environment_kwargs=None):
+                   environment_kwargs=None, physics_profile='default'):
     """Returns the sparse reward variant of the Cartpole Balance task."""
+    environment_kwargs = dict(environment_kwargs or {})
+    control_timestep = environment_kwargs.setdefault('control_timestep', _CONTROL_TIMESTEP)
     physics = Physics.from_xml_string(*get_model_and_assets())
+    physics_profiles.apply(physics, PHYSICS_PROFILES, physics_profile, control_timestep)
     task = Balance(swing_up=False, sparse=True, random=random)
-    environment_kwargs = environment_kwargs or {}
     return ParametricEnvironment(
-        physics, task, time_limit=time_limit, **environment_kwargs)
+        physics, task, physics_profile=physics_profile, time_limit=time_limit,
+        **environment_kwargs)
 
 
 @SUITE.add('benchmarking')
 def swingup(time_limit=_DEFAULT_TIME_LIMIT, random=None,
-            environment_kwargs=None):
+            environment_kwargs=None, physics_profile='default'):
     """Returns the Cartpole Swing-Up task."""
+    environment_kwargs = dict(environment_kwargs or {})
+    control_timestep = environment_kwargs.setdefault('control_timestep', _CONTROL_TIMESTEP)
     physics = Physics.from_xml_string(*get_model_and_assets())
+    physics_profiles.apply(physics, PHYSICS_PROFILES, physics_profile, control_timestep)
     task = Balance(swing_up=True, sparse=False, random=random)
-    environment_kwargs = environment_kwargs or {}
     return ParametricEnvironment(
-        physics, task, time_limit=time_limit, **environment_kwargs)
+        physics, task, physics_profile=physics_profile, time_limit=time_limit,
+        **environment_kwargs)
 
 
 @SUITE.add('benchmarking')
 def swingup_sparse(time_limit=_DEFAULT_TIME_LIMIT, random=None,
-                   environment_kwargs=None):
+                   environment_kwargs=None, physics_profile='default'):
     """Returns the sparse reward variant of the Cartpole Swing-Up task."""
+    environment_kwargs = dict(environment_kwargs or {})
+    control_timestep = environment_kwargs.setdefault('control_timestep', _CONTROL_TIMESTEP)
     physics = Physics.from_xml_string(*get_model_and_assets())
+    physics_profiles.apply(physics, PHYSICS_PROFILES, physics_profile, control_timestep)
     task = Balance(swing_up=True, sparse=True, random=random)
-    environment_kwargs = environment_kwargs or {}
     return ParametricEnvironment(
-        physics, task, time_limit=time_limit, **environment_kwargs)
+        physics, task, physics_profile=physics_profile, time_limit=time_limit,
+        **environment_kwargs)
 
 
 def _make_model(cart_mass=1.0, pole_mass=0.1, pole_length=1.0):
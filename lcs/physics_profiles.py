@@ -0,0 +1,49 @@
+"""Named physics profiles that trade simulation accuracy for throughput.
+
+Each domain defines a `PHYSICS_PROFILES` dict mapping a profile name
+(`'accurate'`, `'default'`, `'fast'`) to the MuJoCo options it overrides:
+
+  n_sub_steps: Number of physics steps per control step. The physics timestep
+    is set to `control_timestep / n_sub_steps`, so the control timestep of the
+    task does not change.
+  integrator: `'Euler'` or `'RK4'`.
+  iterations: Maximum number of constraint solver iterations.
+  tolerance: Tolerance threshold used for early termination of the solver.
+
+Options missing from a profile keep the value from the model XML.
+"""
+
+from dm_control.mujoco.wrapper.mjbindings import enums
+
+_INTEGRATORS = {
+    'Euler': enums.mjtIntegrator.mjINT_EULER,
+    'RK4': enums.mjtIntegrator.mjINT_RK4,
+}
+
+
+def apply(physics, profiles, name, control_timestep):
+    """Applies the physics profile `name` from `profiles` to `physics`.
+
+    Args:
+      physics: An instance of `mujoco.Physics`.
+      profiles: A dict mapping profile names to dicts of options.
+      name: A string containing the name of the profile.
+      control_timestep: The control timestep of the task, in seconds.
+
+    Raises:
+      ValueError: If the profile doesn't exist.
+    """
+    if name not in profiles:
+        raise ValueError('Physics profile {!r} does not exist. Available profiles: {}.'.format(
+            name, ', '.join(profiles)))
+
+    profile = profiles[name]
+    opt = physics.model.opt
+    if 'n_sub_steps' in profile:
+        opt.timestep = control_timestep / profile['n_sub_steps']
+    if 'integrator' in profile:
+        opt.integrator = _INTEGRATORS[profile['integrator']]
+    if 'iterations' in profile:
+        opt.iterations = profile['iterations']
+    if 'tolerance' in profile:
+        opt.tolerance = profile['tolerance']
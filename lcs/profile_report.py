@@ -0,0 +1,119 @@
+"""Reports the error of each physics profile relative to a reference profile.
+
+Every profile is rolled out from the same seeded initial state under the same
+open-loop action sequence. The state trajectory and rewards are then compared
+with those of the reference profile (`accurate` by default):
+
+    python -m lcs.profile_report bipedalwalker walk --seeds 5
+
+Chaotic tasks diverge even for tiny integration errors, so the divergence is
+most informative early in the episode; see `--steps`.
+"""
+
+import argparse
+import inspect
+import math
+import time
+
+import numpy as np
+
+import lcs
+
+# Episode length used for tasks without a finite time limit.
+_DEFAULT_STEPS = 1000
+
+
+def rollout(domain_name, task_name, physics_profile, seed, actions):
+    """Runs `actions` open-loop and returns the states, rewards and wall time."""
+    env = lcs.load(domain_name, task_name, task_kwargs=dict(random=seed, physics_profile=physics_profile))
+    physics = env.physics
+    env.reset()
+
+    states = np.zeros((len(actions), physics.model.nq + physics.model.nv))
+    rewards = np.zeros(len(actions))
+    start = time.perf_counter()
+    for t, action in enumerate(actions):
+        time_step = env.step(action)
+        states[t, :physics.model.nq] = physics.data.qpos
+        states[t, physics.model.nq:] = physics.data.qvel
+        rewards[t] = time_step.reward or 0.0
+        if time_step.last():
+            states, rewards = states[:t + 1], rewards[:t + 1]
+            break
+    wall_time = time.perf_counter() - start
+    return states, rewards, wall_time
+
+
+def compare(domain_name, task_name, profiles=None, reference='accurate', seeds=3, steps=None):
+    """Returns a dict mapping each profile name to its error metrics, averaged over seeds.
+
+    Metrics:
+      state_error: Mean L2 distance between the (qpos, qvel) trajectories.
+      final_state_error: L2 distance between the final states.
+      reward_error: Mean absolute per-step reward difference.
+      return_drift: Relative difference of the episode return.
+      steps_per_second: Control steps per second of wall time.
+      speedup: Throughput relative to the reference profile.
+
+    Args:
+      domain_name: A string containing the name of a domain.
+      task_name: A string containing the name of a task.
+      profiles: Names of the profiles to compare. Defaults to all profiles of the domain.
+      reference: Name of the profile used as ground truth.
+      seeds: Number of seeded episodes.
+      steps: Number of control steps per episode. Defaults to the full episode,
+        or 1000 steps for tasks without a time limit.
+    """
+    domain = lcs._DOMAINS[domain_name]
+    profiles = list(profiles or domain.PHYSICS_PROFILES)
+    if reference not in profiles:
+        profiles.insert(0, reference)
+
+    env = lcs.load(domain_name, task_name)
+    spec = env.action_spec()
+    if not steps:
+        time_limit = inspect.signature(domain.SUITE[task_name]).parameters['time_limit'].default
+        steps = round(time_limit / env.control_timestep()) if math.isfinite(time_limit) else _DEFAULT_STEPS
+    env.close()
+
+    metrics = {name: [] for name in profiles}
+    for seed in range(seeds):
+        actions = np.random.RandomState(seed).uniform(spec.minimum, spec.maximum, size=(steps,) + spec.shape)
+
+        results = {name: rollout(domain_name, task_name, name, seed, actions) for name in profiles}
+        ref_states, ref_rewards, ref_time = results[reference]
+        for name, (states, rewards, wall_time) in results.items():
+            n = min(len(states), len(ref_states))
+            distance = np.linalg.norm(states[:n] - ref_states[:n], axis=-1)
+            ref_return = ref_rewards.sum()
+            metrics[name].append(dict(
+                state_error=distance.mean(),
+                final_state_error=distance[-1],
+                reward_error=np.abs(rewards[:n] - ref_rewards[:n]).mean(),
+                return_drift=(rewards.sum() - ref_return) / max(abs(ref_return), 1e-8),
+                steps_per_second=len(states) / wall_time,
+                speedup=(len(states) / wall_time) / (len(ref_states) / ref_time),
+            ))
+    return {name: {key: float(np.mean([m[key] for m in runs])) for key in runs[0]}
+            for name, runs in metrics.items()}
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('domain_name')
+    parser.add_argument('task_name')
+    parser.add_argument('--profiles', nargs='+', default=None)
+    parser.add_argument('--reference', default='accurate')
+    parser.add_argument('--seeds', type=int, default=3)
+    parser.add_argument('--steps', type=int, default=None)
+    args = parser.parse_args(argv)
+
+    report = compare(args.domain_name, args.task_name, args.profiles, args.reference, args.seeds, args.steps)
+    keys = list(next(iter(report.values())))
+    print(f"{'profile':<12}" + ''.join(f'{key:>20}' for key in keys))
+    for name, metrics in report.items():
+        print(f'{name:<12}' + ''.join(f'{metrics[key]:>20.4g}' for key in keys))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,159 @@
+"""Fixed-rate real-time stepping of LCS environments.
+
+Steps an environment at its control timestep against the wall clock and
+records whether each step (policy, physics, observation, reward and optional
+rendering) fits within the control period:
+
+    python -m lcs.realtime bipedalwalker walk --steps 2000 --render --latency 0.05
+"""
+
+import argparse
+import collections
+import math
+import time
+
+import numpy as np
+
+import lcs
+
+
+class RealTimeRunner:
+    """Runs an LCS gym environment at a fixed control rate.
+
+    Ticks are scheduled on absolute deadlines (`start + k * period`), so timing
+    errors do not accumulate. The runner sleeps until shortly before each tick
+    and busy-waits for the rest, which keeps the jitter well below the
+    resolution of `time.sleep` alone. When a step overruns its period, the
+    deadline is counted as missed and the schedule skips to the next free tick
+    instead of running late steps back to back.
+
+    Args:
+      env: A gym environment from `lcs.make_gym_env`.
+      policy: A callable mapping an observation to an action. `None` samples
+        random actions.
+      period: Control period in seconds. Defaults to the control timestep of
+        the task times the `frame_skip` of the environment.
+      latency: Action latency in seconds. Whole periods delay the action
+        computed from an observation by that many ticks, with zero actions
+        applied until the first one arrives. The remainder is waited out within
+        the tick, at `tick + remainder`, before the action is applied.
+      render: If `True`, a frame is rendered every step, so that rendering
+        counts against the period. Pixel environments already render their
+        observation and are not rendered twice.
+      spin: Time in seconds spent busy-waiting before each tick.
+    """
+
+    def __init__(self, env, policy=None, period=None, latency=0.0, render=False, spin=1e-3):
+        self.env = env
+        self.policy = policy
+        unwrapped = env.unwrapped
+        self.period = period or unwrapped.env.control_timestep() * unwrapped.frame_skip
+        self.delay = int((latency + 1e-9) // self.period)
+        self.in_tick_latency = max(latency - self.delay * self.period, 0.0)
+        self.render = render and not unwrapped.from_pixels
+        self.spin = spin
+
+    def _wait_until(self, deadline):
+        remaining = deadline - time.perf_counter()
+        if remaining > self.spin:
+            time.sleep(remaining - self.spin)
+        while time.perf_counter() < deadline:
+            pass
+
+    def _reset(self):
+        zero_action = np.zeros(self.env.action_space.shape, dtype=self.env.action_space.dtype)
+        self._pending = collections.deque([zero_action] * self.delay)
+        return self.env.reset()
+
+    def run(self, steps):
+        """Runs `steps` control steps and returns a dict of timing statistics.
+
+        Times are in milliseconds. `latency` is the compute time of a step: the
+        policy, physics, observation, reward and rendering, without the
+        injected action latency. `end_to_end` is the time from a tick to the end
+        of its step, including the injected latency, and is what deadline
+        misses are counted against. `jitter` is the delay of a tick past its
+        scheduled time. Episode resets happen outside of the schedule and are
+        not timed.
+        """
+        latencies = np.zeros(steps)
+        end_to_end = np.zeros(steps)
+        jitter = np.zeros(steps)
+        deadline_misses = skipped_ticks = 0
+        physics = self.env.unwrapped.env.physics
+        render_kwargs = self.env.unwrapped.render_kwargs
+
+        obs = self._reset()
+        tick = time.perf_counter()
+        for k in range(steps):
+            self._wait_until(tick)
+            start = time.perf_counter()
+
+            action = self.env.action_space.sample() if self.policy is None else np.asarray(self.policy(obs))
+            self._pending.append(action)
+            policy_time = time.perf_counter() - start
+            if self.in_tick_latency:
+                self._wait_until(tick + self.in_tick_latency)
+            step_start = time.perf_counter()
+            obs, reward, done, info = self.env.step(self._pending.popleft())
+            if self.render:
+                physics.render(**render_kwargs)
+
+            end = time.perf_counter()
+            latencies[k] = policy_time + end - step_start
+            end_to_end[k] = end - start
+            jitter[k] = start - tick
+
+            tick += self.period
+            if end > tick:
+                deadline_misses += 1
+                skipped = math.ceil((end - tick) / self.period)
+                skipped_ticks += skipped
+                tick += skipped * self.period
+            if done:
+                obs = self._reset()
+                tick = time.perf_counter()
+
+        latencies *= 1e3
+        end_to_end *= 1e3
+        jitter *= 1e3
+        return dict(
+            steps=steps,
+            period=self.period * 1e3,
+            deadline_misses=deadline_misses,
+            miss_rate=deadline_misses / steps,
+            skipped_ticks=skipped_ticks,
+            utilization=latencies.mean() / (self.period * 1e3),
+            latency_p50=np.percentile(latencies, 50),
+            latency_p90=np.percentile(latencies, 90),
+            latency_p99=np.percentile(latencies, 99),
+            latency_max=latencies.max(),
+            end_to_end_p50=np.percentile(end_to_end, 50),
+            end_to_end_p99=np.percentile(end_to_end, 99),
+            end_to_end_max=end_to_end.max(),
+            jitter_p50=np.percentile(jitter, 50),
+            jitter_p99=np.percentile(jitter, 99),
+            jitter_max=jitter.max(),
+        )
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('domain_name')
+    parser.add_argument('task_name')
+    parser.add_argument('--steps', type=int, default=1000)
+    parser.add_argument('--latency', type=float, default=0.0, help='Action latency in seconds.')
+    parser.add_argument('--render', action='store_true', help='Render a frame every step.')
+    parser.add_argument('--from-pixels', action='store_true')
+    parser.add_argument('--physics-profile', default='default')
+    args = parser.parse_args(argv)
+
+    env = lcs.make_gym_env(domain_name=args.domain_name, task_name=args.task_name, from_pixels=args.from_pixels,
+                           task_kwargs=dict(physics_profile=args.physics_profile))
+    stats = RealTimeRunner(env, latency=args.latency, render=args.render).run(args.steps)
+    for key, value in stats.items():
+        print(f'{key:<16} {value:>10.4g}')
+
+
+if __name__ == '__main__':
+    main()
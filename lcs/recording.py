@@ -0,0 +1,136 @@
+"""Streaming video recording of LCS rollouts.
+
+Frames are rendered straight into the stdin of an encoder subprocess (ffmpeg by
+default), so memory stays constant regardless of the episode length and no
+intermediate images are written to disk.
+"""
+
+import os
+import subprocess
+from pathlib import Path
+
+import gym
+import numpy as np
+
+
+class VideoRecorder(gym.Wrapper):
+    """Records each episode of an `LCSEnv` to a video file.
+
+    ```python
+    env = lcs.make_gym_env(domain_name='bipedalwalker', task_name='walk', frame_skip=4)
+    env = VideoRecorder(env, 'videos/walk_{episode:03d}.mp4', camera_id='side', fps=30)
+    ```
+
+    Frames are taken at a fixed rate in simulation time, independent of the
+    `frame_skip` of the wrapped environment: while an episode is recorded, the
+    step of the underlying dm_control environment is wrapped, so frames are
+    rendered between the control steps that one gym `step` runs. Only when
+    `fps` exceeds the control rate is a frame repeated, so that the video
+    still plays back in real time.
+
+    Args:
+      env: An `LCSEnv`, or a gym wrapper around one.
+      path: Output file name. It is formatted with `episode=<index>`, so that
+        every episode goes to its own file.
+      camera_id: Camera index or name, e.g. `'lookatcart'` for the cartpole or
+        `'side'` / `'back'` for the walker.
+      height: Frame height in pixels. Must be even for `yuv420p` encoding.
+      width: Frame width in pixels. Must be even for `yuv420p` encoding.
+      fps: Video frame rate, in frames per simulated second. Defaults to the
+        control rate of the environment.
+      encoder: Name or path of the ffmpeg executable.
+      codec: Video codec passed to the encoder.
+    """
+
+    def __init__(self, env, path='videos/episode_{episode:04d}.mp4',
+                 camera_id=0,
+                 height=240,
+                 width=320,
+                 fps=None,
+                 encoder='ffmpeg',
+                 codec='libx264',
+                 ):
+        if width % 2 or height % 2:
+            raise ValueError('Video width and height must be even, got {}x{}.'.format(width, height))
+        super().__init__(env)
+        self.path = path
+        self.camera_id = camera_id
+        self.height = height
+        self.width = width
+        self.fps = fps or env.metadata['video.frames_per_second']
+        self.encoder = encoder
+        self.codec = codec
+
+        self.episode = -1
+        self._process = None
+        self._next_frame_time = 0.0
+
+    @property
+    def physics(self):
+        return self.unwrapped.env.physics
+
+    def reset(self, **kwargs):
+        self._close_encoder()
+        obs = self.env.reset(**kwargs)
+        self.episode += 1
+        self._open_encoder(self.path.format(episode=self.episode))
+        self._next_frame_time = self.physics.data.time
+        self._record()
+        return obs
+
+    def step(self, action):
+        obs, reward, done, info = self.env.step(action)
+        if done:
+            self._close_encoder()
+        return obs, reward, done, info
+
+    def close(self):
+        self._close_encoder()
+        return super().close()
+
+    def _control_step(self, action):
+        time_step = self._dm_env_step(action)
+        self._record()
+        return time_step
+
+    def _record(self):
+        """Writes one frame for every frame period elapsed in simulation time."""
+        if self._process is None:
+            return
+        period = 1.0 / self.fps
+        time = self.physics.data.time
+        if time + 1e-9 < self._next_frame_time:
+            return
+        # Only render once, even if the frame is repeated to fill a long step.
+        # The rendered array is written as is, `ascontiguousarray` only copies a flipped view.
+        frame = np.ascontiguousarray(
+            self.physics.render(height=self.height, width=self.width, camera_id=self.camera_id))
+        while self._next_frame_time <= time + 1e-9:
+            self._process.stdin.write(frame.data)
+            self._next_frame_time += period
+
+    def _open_encoder(self, path):
+        Path(path).parent.mkdir(parents=True, exist_ok=True)
+        command = [
+            self.encoder, '-y', '-loglevel', 'error',
+            '-f', 'rawvideo', '-pix_fmt', 'rgb24',
+            '-s', f'{self.width}x{self.height}',
+            '-r', f'{self.fps}',
+            '-i', '-',
+            '-an', '-vcodec', self.codec, '-pix_fmt', 'yuv420p',
+            os.fspath(path),
+        ]
+        self._process = subprocess.Popen(command, stdin=subprocess.PIPE)
+        # info: shadows the bound method on the dm_control env for the duration of the episode.
+        dm_env = self.unwrapped.env
+        self._dm_env_step = dm_env.step
+        dm_env.step = self._control_step
+
+    def _close_encoder(self):
+        if self._process is None:
+            return
+        process, self._process = self._process, None
+        del self.unwrapped.env.step
+        process.stdin.close()
+        if process.wait() != 0:
+            raise RuntimeError('Video encoder {!r} exited with code {}.'.format(self.encoder, process.returncode))
@@ -0,0 +1,108 @@
+"""Fixed-horizon rollout collection for on-policy learners.
+
+```python
+envs = [lcs.make_gym_env(domain_name='bipedalwalker', task_name='walk') for _ in range(8)]
+rollouts = RolloutCollector(envs, horizon=256, gamma=0.99, gae_lambda=0.95)
+for iteration in range(1000):
+    rollouts.collect(policy)  # policy(obs[N, ...]) -> (actions[N, ...], values[N])
+    learner.update(rollouts.obs, rollouts.actions, rollouts.returns, rollouts.advantages)
+```
+
+All buffers are `(T, N, ...)` arrays allocated once and overwritten in place by
+every call to `collect`, so learners should copy anything they keep across
+iterations. `rollouts.obs.reshape(T * N, ...)` is a view.
+"""
+
+import numpy as np
+
+
+class RolloutCollector:
+    """Collects `horizon` steps from each of `N` LCS gym environments.
+
+    Environments are reset automatically at the end of an episode. The final
+    observation of each episode is kept in `terminal_obs`, and episodes that end
+    on the time limit are bootstrapped from its value. These are told apart from
+    terminations by the non-zero `info['discount']` that `LCSEnv.step` reports;
+    environments without it treat every episode end as a termination.
+
+    Args:
+      envs: A list of gym environments, e.g. from `lcs.make_gym_env`.
+      horizon: Number of steps `T` collected from each environment per call.
+      gamma: Discount factor.
+      gae_lambda: The lambda of generalized advantage estimation.
+    """
+
+    def __init__(self, envs, horizon, gamma=0.99, gae_lambda=0.95):
+        self.envs = envs
+        self.horizon = horizon
+        self.gamma = gamma
+        self.gae_lambda = gae_lambda
+
+        obs_space = envs[0].observation_space
+        act_space = envs[0].action_space
+        shape = (horizon, len(envs))
+        self.obs = np.zeros(shape + obs_space.shape, dtype=obs_space.dtype)
+        self.terminal_obs = np.zeros_like(self.obs)
+        self.actions = np.zeros(shape + act_space.shape, dtype=act_space.dtype)
+        self.rewards = np.zeros(shape, dtype=np.float32)
+        self.dones = np.zeros(shape, dtype=bool)
+        self.discounts = np.zeros(shape, dtype=np.float32)
+        self.values = np.zeros(shape, dtype=np.float32)
+        self.terminal_values = np.zeros(shape, dtype=np.float32)
+        self.advantages = np.zeros(shape, dtype=np.float32)
+        self.returns = np.zeros(shape, dtype=np.float32)
+
+        self.next_obs = np.zeros((len(envs),) + obs_space.shape, dtype=obs_space.dtype)
+        self.last_values = np.zeros(len(envs), dtype=np.float32)
+        self._gae = np.zeros(len(envs), dtype=np.float32)
+        self.reset()
+
+    def reset(self):
+        """Resets all environments."""
+        for i, env in enumerate(self.envs):
+            self.next_obs[i] = env.reset()
+
+    def collect(self, policy, value_fn=None):
+        """Fills the buffers with one segment and computes returns and advantages.
+
+        Args:
+          policy: A callable mapping a batch of observations `[N, ...]` to a
+            tuple of actions `[N, ...]` and values `[N]`.
+          value_fn: Optional callable mapping a batch of observations to values,
+            used to bootstrap from the last and the terminal observations. By
+            default the values returned by `policy` are used.
+        """
+        value_fn = value_fn or (lambda obs: policy(obs)[1])
+
+        self.terminal_values.fill(0)
+        for t in range(self.horizon):
+            self.obs[t] = self.next_obs
+            self.actions[t], self.values[t] = policy(self.obs[t])
+            for i, env in enumerate(self.envs):
+                obs, reward, done, info = env.step(self.actions[t, i])
+                self.rewards[t, i] = reward
+                self.dones[t, i] = done
+                self.discounts[t, i] = info.get('discount', 0.0 if done else 1.0)
+                if done:
+                    self.terminal_obs[t, i] = obs
+                    obs = env.reset()
+                self.next_obs[i] = obs
+
+        self.last_values[:] = value_fn(self.next_obs)
+        truncated = self.dones & (self.discounts > 0)
+        if truncated.any():
+            self.terminal_values[truncated] = value_fn(self.terminal_obs[truncated])
+        self.compute_returns()
+
+    def compute_returns(self):
+        """Computes GAE advantages and returns, vectorized over environments."""
+        self._gae.fill(0)
+        next_values = self.last_values
+        for t in reversed(range(self.horizon)):
+            not_done = 1.0 - self.dones[t]
+            bootstrap = not_done * next_values + self.discounts[t] * self.dones[t] * self.terminal_values[t]
+            delta = self.rewards[t] + self.gamma * bootstrap - self.values[t]
+            self._gae[:] = delta + self.gamma * self.gae_lambda * not_done * self._gae
+            self.advantages[t] = self._gae
+            next_values = self.values[t]
+        np.add(self.advantages, self.values, out=self.returns)
@@ -1,16 +1,85 @@
-# This is a sample Python script.
+"""Evaluates a policy over a selection of LCS tasks, in parallel across local cores.
 
-# Press ⇧F10 to execute it or replace it with your code.
-# Press Double ⇧ to search everywhere for classes, files, tool windows, actions, and settings.
+    python main.py --policy random --tasks BENCHMARKING --seeds 10
+    python main.py --policy my_agent.policies:walker_policy --tasks bipedalwalker --seeds 5
+    python main.py --policy checkpoints/cartpole.pt --tasks Paramcartpole-swingup-v1
+"""
 
+import argparse
+import multiprocessing
+import os
+import sys
+import time
+from collections import defaultdict
 
-def print_hi(name):
-    # Use a breakpoint in the code line below to debug your script.
-    print(f'Hi, {name}')  # Press ⌘F8 to toggle the breakpoint.
+import numpy as np
 
+from lcs.evaluation import load_policy, resolve_tasks, run_episode
 
-# Press the green button in the gutter to run the script.
-if __name__ == '__main__':
-    print_hi('PyCharm')
+_POLICY = None
+
+
+def _init_worker(policy_spec):
+    global _POLICY
+    _POLICY = load_policy(policy_spec)
+    # One process per core already uses every core, so torch must not spawn its own threads on top.
+    if 'torch' in sys.modules:
+        sys.modules['torch'].set_num_threads(1)
+
+
+def _run_job(job):
+    domain_name, task_name, seed, env_kwargs = job
+    return run_episode(domain_name, task_name, seed, policy=_POLICY, **env_kwargs)
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--policy', default='random',
+                        help="'random', an import path 'module:attribute', or a checkpoint file (.pt, .pth, .pkl).")
+    parser.add_argument('--tasks', nargs='+', default=['BENCHMARKING'],
+                        help="Task sets (BENCHMARKING, EASY, HARD, ALL_TASKS), domain names, "
+                             "'domain:task' pairs or gym ids.")
+    parser.add_argument('--seeds', type=int, default=10, help='Number of seeded episodes per task.')
+    parser.add_argument('--frame-skip', type=int, default=1)
+    parser.add_argument('--physics-profile', default='default', help="Physics profile, e.g. 'accurate' or 'fast'.")
+    parser.add_argument('--workers', type=int, default=os.cpu_count(), help='Number of worker processes.')
+    return parser.parse_args(argv)
 
-# See PyCharm help at https://www.jetbrains.com/help/pycharm/
+
+def main(argv=None):
+    args = parse_args(argv)
+    tasks = resolve_tasks(args.tasks)
+    env_kwargs = dict(frame_skip=args.frame_skip, task_kwargs=dict(physics_profile=args.physics_profile))
+    jobs = [(domain_name, task_name, seed, env_kwargs)
+            for domain_name, task_name in tasks
+            for seed in range(args.seeds)]
+    workers = max(1, min(args.workers, len(jobs)))
+
+    print(f'Evaluating {args.policy!r} on {len(tasks)} tasks x {args.seeds} seeds with {workers} workers.')
+    # steps/s is the throughput of a single worker, cpu (s) the summed time of all episodes of a task, and
+    # wall (s) the time from its first episode starting to its last one finishing. All include building the envs.
+    print(f"{'task':<32} {'mean':>9} {'std':>9} {'min':>9} {'max':>9} {'steps/s':>9} {'cpu (s)':>9} {'wall (s)':>9}")
+
+    results = defaultdict(list)
+    total_steps = 0
+    start = time.perf_counter()
+    with multiprocessing.Pool(workers, initializer=_init_worker, initargs=(args.policy,)) as pool:
+        for result in pool.imap_unordered(_run_job, jobs):
+            key = result['domain_name'], result['task_name']
+            results[key].append(result)
+            total_steps += result['steps']
+            if len(results[key]) < args.seeds:
+                continue
+            returns = np.array([r['episode_return'] for r in results[key]])
+            steps = sum(r['steps'] for r in results[key])
+            cpu_time = sum(r['wall_time'] for r in results[key])
+            wall_time = max(r['finished'] for r in results[key]) - min(r['started'] for r in results[key])
+            print(f"{':'.join(key):<32} {returns.mean():>9.2f} {returns.std():>9.2f} {returns.min():>9.2f} "
+                  f"{returns.max():>9.2f} {steps / cpu_time:>9.0f} {cpu_time:>9.1f} {wall_time:>9.1f}", flush=True)
+
+    elapsed = time.perf_counter() - start
+    print(f'Done: {total_steps} environment steps in {elapsed:.1f}s ({total_steps / elapsed:.0f} steps/s overall).')
+
+
+if __name__ == '__main__':
+    main()
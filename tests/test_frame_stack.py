@@ -0,0 +1,54 @@
+import numpy as np
+
+from lcs.frame_stack import FrameBuffer
+
+
+def _frame(value, shape=(1, 2, 2)):
+    return np.full(shape, value, dtype=np.uint8)
+
+
+def test_reset_fills_the_stack_with_the_first_frame():
+    frames = FrameBuffer(k=3)
+    obs = frames.push(_frame(7))
+    assert obs.shape == (3, 2, 2)
+    np.testing.assert_array_equal(obs[:, 0, 0], [7, 7, 7])
+
+
+def test_stack_is_ordered_oldest_to_newest():
+    frames = FrameBuffer(k=4)
+    frames.push(_frame(0))
+    for value in range(1, 20):
+        obs = frames.push(_frame(value))
+    np.testing.assert_array_equal(obs[:, 0, 0], [16, 17, 18, 19])
+
+
+def test_previous_observation_survives_the_next_push():
+    frames = FrameBuffer(k=4)
+    obs = frames.push(_frame(0))
+    # Enough pushes to wrap around the end of the buffer several times.
+    for value in range(1, 40):
+        expected = obs.copy()
+        next_obs = frames.push(_frame(value))
+        np.testing.assert_array_equal(obs, expected)
+        obs = next_obs
+
+
+def test_previous_observation_survives_a_reset():
+    frames = FrameBuffer(k=3)
+    frames.push(_frame(0))
+    for value in range(1, 12):
+        obs = frames.push(_frame(value))
+        expected = obs.copy()
+        frames.reset()
+        np.testing.assert_array_equal(frames.push(_frame(100))[:, 0, 0], [100, 100, 100])
+        np.testing.assert_array_equal(obs, expected)
+        frames.push(_frame(value))
+
+
+def test_channels_last_stacks_along_the_last_axis():
+    frames = FrameBuffer(k=2, channels_first=False)
+    frames.push(_frame(1, shape=(2, 2, 3)))
+    obs = frames.push(_frame(2, shape=(2, 2, 3)))
+    assert obs.shape == (2, 2, 6)
+    np.testing.assert_array_equal(obs[0, 0], [1, 1, 1, 2, 2, 2])
+    assert np.shares_memory(obs, frames._buffer)
@@ -0,0 +1,66 @@
+import numpy as np
+
+from lcs.rollout import RolloutCollector
+
+
+class _Space:
+    def __init__(self, shape, dtype):
+        self.shape = shape
+        self.dtype = dtype
+
+
+class _CountingEnv:
+    """Observation is the step count. Episodes end after `length` steps, on the time limit."""
+    observation_space = _Space((1,), np.float32)
+    action_space = _Space((1,), np.float32)
+
+    def __init__(self, length):
+        self.length = length
+        self.t = 0
+
+    def reset(self):
+        self.t = 0
+        return np.zeros(1)
+
+    def step(self, action):
+        self.t += 1
+        done = self.t == self.length
+        return np.full(1, self.t), 1.0, done, dict(discount=1.0)
+
+
+def _policy(obs):
+    return np.zeros((len(obs), 1)), 0.5 * np.ones(len(obs))
+
+
+def test_truncated_episode_bootstraps_from_terminal_value():
+    gamma, gae_lambda = 0.9, 0.8
+    rollouts = RolloutCollector([_CountingEnv(length=2)], horizon=4, gamma=gamma, gae_lambda=gae_lambda)
+    # The value of an observation is its step count, so bootstrapping from the terminal obs is visible.
+    rollouts.collect(_policy, value_fn=lambda obs: obs[:, 0].astype(np.float32))
+
+    np.testing.assert_array_equal(rollouts.dones[:, 0], [False, True, False, True])
+    np.testing.assert_array_equal(rollouts.discounts[:, 0], [1, 1, 1, 1])
+    np.testing.assert_array_equal(rollouts.terminal_obs[[1, 3], 0, 0], [2, 2])
+    np.testing.assert_array_equal(rollouts.terminal_values[:, 0], [0, 2, 0, 2])
+
+    # Reference GAE over one episode of two steps, bootstrapped with V(terminal) = 2.
+    delta_1 = 1.0 + gamma * 2.0 - 0.5
+    delta_0 = 1.0 + gamma * 0.5 - 0.5
+    advantages = [delta_0 + gamma * gae_lambda * delta_1, delta_1]
+    np.testing.assert_allclose(rollouts.advantages[:, 0], advantages * 2, rtol=1e-6)
+    np.testing.assert_allclose(rollouts.returns[:, 0], np.array(advantages * 2) + 0.5, rtol=1e-6)
+
+
+def test_terminated_episode_does_not_bootstrap():
+    rollouts = RolloutCollector([_CountingEnv(length=2)], horizon=2, gamma=0.9, gae_lambda=0.8)
+    rollouts.rewards[:] = 1.0
+    rollouts.values[:] = 0.5
+    rollouts.dones[:] = [[False], [True]]
+    rollouts.discounts[:] = [[1.0], [0.0]]
+    rollouts.terminal_values[:] = 10.0
+    rollouts.last_values[:] = 10.0
+    rollouts.compute_returns()
+
+    delta_1 = 1.0 - 0.5
+    delta_0 = 1.0 + 0.9 * 0.5 - 0.5
+    np.testing.assert_allclose(rollouts.advantages[:, 0], [delta_0 + 0.9 * 0.8 * delta_1, delta_1], rtol=1e-6)